@@ -9,6 +9,9 @@ from .csf_models import (
     PartyType,
     RelationshipType,
     ImplementationTier,
+    ImplementationStatus,
+    RiskLevel,
+    Priority,
     
     # Core Models
     CSFDocument,
@@ -30,7 +33,9 @@ from .csf_models import (
     
     # Utility Functions
     create_element_from_dict,
-    load_framework_from_json
+    load_framework_from_json,
+    parse_records_json,
+    frozen_clock
 )
 
 __all__ = [
@@ -40,6 +45,9 @@ __all__ = [
     'PartyType',
     'RelationshipType',
     'ImplementationTier',
+    'ImplementationStatus',
+    'RiskLevel',
+    'Priority',
     
     # Core Models
     'CSFDocument',
@@ -61,5 +69,7 @@ __all__ = [
     
     # Utility Functions
     'create_element_from_dict',
-    'load_framework_from_json'
+    'load_framework_from_json',
+    'parse_records_json',
+    'frozen_clock'
 ]
\ No newline at end of file
@@ -5,12 +5,73 @@ This module provides type-safe data models for the NIST CSF 2.0 framework,
 including functions, categories, subcategories, and implementation examples.
 """
 
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
-import re
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterator, Literal, Type, TypeVar, Union
+from functools import lru_cache
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, computed_field, field_validator, model_validator, ConfigDict
+from pydantic import VERSION as PYDANTIC_VERSION
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+
+# orjson is optional; it decodes the framework JSON faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Identifier shape checks. CSF identifiers have fixed layouts (XX.YY,
+# XX.YY-NN), so length and ASCII character-class tests on slices
+# are enough and avoid running the regex engine for every element.
+
+def _is_upper_pair(v: str) -> bool:
+    """Check for two ASCII capital letters (e.g., GV or OC)"""
+    return len(v) == 2 and v.isascii() and v.isalpha() and v.isupper()
+
+
+def _is_category_id(v: str) -> bool:
+    """Check for a category identifier (e.g., GV.OC)"""
+    return len(v) == 5 and v[2] == '.' and _is_upper_pair(v[:2]) and _is_upper_pair(v[3:])
+
+
+def _is_subcategory_id(v: str) -> bool:
+    """Check for a subcategory identifier (e.g., GV.OC-01)"""
+    return (len(v) == 8 and v[5] == '-' and _is_category_id(v[:5])
+            and v[6:].isascii() and v[6:].isdigit())
+
+
+def _head(identifier: str, sep: str) -> str:
+    """Return the part of identifier before the first sep (same as split(sep)[0])"""
+    idx = identifier.find(sep)
+    return identifier if idx == -1 else identifier[:idx]
+
+
+def _separator_prefixes(identifier: str, sep: str):
+    """Yield each prefix of identifier that ends just before sep"""
+    idx = identifier.find(sep)
+    while idx != -1:
+        yield identifier[:idx]
+        idx = identifier.find(sep, idx + 1)
+
+
+def _index_by_prefixes(elements: Dict[str, 'BaseCSFElement'], sep: str) -> Dict[str, List['BaseCSFElement']]:
+    """Index elements under each separator prefix of their identifier"""
+    index = defaultdict(list)
+    for identifier, element in elements.items():
+        for prefix in _separator_prefixes(identifier, sep):
+            index[prefix].append(element)
+    return index
 
 
 # ============================================================================
@@ -29,23 +90,19 @@ class CSFFunction(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> 'CSFFunction':
         """Convert string to CSFFunction enum"""
-        value_upper = value.upper()
-        for func in cls:
-            if func.value == value_upper or func.name == value_upper:
-                return func
-        raise ValueError(f"Invalid CSF Function: {value}")
+        func = _FUNCTIONS_BY_CODE_OR_NAME.get(value.upper())
+        if func is None:
+            raise ValueError(f"Invalid CSF Function: {value}")
+        return func
     
     def get_full_name(self) -> str:
         """Get the full name of the function"""
-        names = {
-            self.GOVERN: "GOVERN",
-            self.IDENTIFY: "IDENTIFY",
-            self.PROTECT: "PROTECT",
-            self.DETECT: "DETECT",
-            self.RESPOND: "RESPOND",
-            self.RECOVER: "RECOVER"
-        }
-        return names[self]
+        # Member names are the full function names (GOVERN, IDENTIFY, ...)
+        return self.name
+
+
+# Lookup for CSFFunction.from_string by code ("GV") or full name ("GOVERN")
+_FUNCTIONS_BY_CODE_OR_NAME = {key: func for func in CSFFunction for key in (func.value, func.name)}
 
 
 class ElementType(str, Enum):
@@ -58,6 +115,15 @@ class ElementType(str, Enum):
     WITHDRAW_REASON = "withdraw_reason"
 
 
+# Raw element type values. Elements store element_type as a plain str
+# (use_enum_values=True), so hot paths compare against these directly.
+_ET_FUNCTION = ElementType.FUNCTION.value
+_ET_CATEGORY = ElementType.CATEGORY.value
+_ET_SUBCATEGORY = ElementType.SUBCATEGORY.value
+_ET_IMPL_EX = ElementType.IMPLEMENTATION_EXAMPLE.value
+_ET_PARTY = ElementType.PARTY.value
+
+
 class PartyType(str, Enum):
     """Risk party types"""
     FIRST_PARTY = "first"
@@ -84,6 +150,35 @@ class ImplementationTier(str, Enum):
     TIER_4_ADAPTIVE = "Tier 4 - Adaptive"
 
 
+class ImplementationStatus(str, Enum):
+    """Implementation status of a subcategory"""
+    NOT_IMPLEMENTED = "Not Implemented"
+    PARTIALLY_IMPLEMENTED = "Partially Implemented"
+    LARGELY_IMPLEMENTED = "Largely Implemented"
+    FULLY_IMPLEMENTED = "Fully Implemented"
+
+
+class RiskLevel(str, Enum):
+    """Risk levels for risk assessments"""
+    LOW = "Low"
+    MEDIUM = "Medium"
+    HIGH = "High"
+    CRITICAL = "Critical"
+
+
+class Priority(str, Enum):
+    """Priority levels for closing gaps"""
+    LOW = "Low"
+    MEDIUM = "Medium"
+    HIGH = "High"
+    CRITICAL = "Critical"
+
+
+_FUNCTION_IDS = frozenset(func.value for func in CSFFunction)
+_PARTY_IDS = frozenset({'first', 'third'})
+_RELATIONSHIP_TYPES = frozenset(rel.value for rel in RelationshipType)
+
+
 # ============================================================================
 # BASE MODELS
 # ============================================================================
@@ -106,7 +201,9 @@ class CSFDocument(BaseModel):
 
 class BaseCSFElement(BaseModel):
     """Base class for all CSF elements"""
-    model_config = ConfigDict(use_enum_values=True)
+    # Elements are immutable reference data; freezing them keeps the
+    # framework caches consistent
+    model_config = ConfigDict(use_enum_values=True, frozen=True, extra='ignore', validate_assignment=False)
     
     doc_identifier: str = Field(..., description="Document identifier")
     element_identifier: str = Field(..., description="Unique element identifier")
@@ -123,32 +220,30 @@ class BaseCSFElement(BaseModel):
         if not v:
             raise ValueError("Element identifier cannot be empty")
         
-        if element_type == ElementType.FUNCTION:
-            # Functions should be 2 uppercase letters
-            if not re.match(r'^[A-Z]{2}$', v):
-                raise ValueError(f"Function identifier must be 2 uppercase letters: {v}")
-        elif element_type == ElementType.CATEGORY:
+        if element_type == _ET_FUNCTION:
+            # Functions must be one of the six CSF 2.0 function codes
+            if v not in _FUNCTION_IDS:
+                raise ValueError(f"Invalid function identifier: {v}")
+        elif element_type == _ET_CATEGORY:
             # Categories should be function.category (e.g., GV.OC)
-            if not re.match(r'^[A-Z]{2}\.[A-Z]{2}$', v):
+            if not _is_category_id(v):
                 raise ValueError(f"Category identifier must follow XX.YY format: {v}")
-        elif element_type == ElementType.SUBCATEGORY:
+        elif element_type == _ET_SUBCATEGORY:
             # Subcategories should be function.category-number (e.g., GV.OC-01)
-            if not re.match(r'^[A-Z]{2}\.[A-Z]{2}-\d{2}$', v):
+            if not _is_subcategory_id(v):
                 raise ValueError(f"Subcategory identifier must follow XX.YY-NN format: {v}")
-        elif element_type == ElementType.IMPLEMENTATION_EXAMPLE:
-            # Implementation examples have various formats
-            if not (re.match(r'^[A-Z]{2}\.[A-Z]{2}-\d{2}\.\d{3}$', v) or 
-                    v in ['first', 'third']):
-                pass  # Implementation examples have flexible formats
+        elif element_type == _ET_PARTY:
+            if v not in _PARTY_IDS:
+                raise ValueError(f"Party identifier must be 'first' or 'third': {v}")
         
         return self
     
     def get_function(self) -> Optional[CSFFunction]:
         """Extract the function from the element identifier"""
-        if self.element_type == ElementType.FUNCTION:
+        if self.element_type == _ET_FUNCTION:
             return CSFFunction(self.element_identifier)
         elif '.' in self.element_identifier:
-            func_code = self.element_identifier.split('.')[0]
+            func_code = _head(self.element_identifier, '.')
             try:
                 return CSFFunction(func_code)
             except ValueError:
@@ -163,66 +258,69 @@ class BaseCSFElement(BaseModel):
 class CSFFunctionElement(BaseCSFElement):
     """Represents a CSF Function (GOVERN, IDENTIFY, etc.)"""
     element_type: Literal[ElementType.FUNCTION] = Field(default=ElementType.FUNCTION)
-    
-    @field_validator('element_identifier')
-    @classmethod
-    def validate_function_id(cls, v):
-        """Ensure function ID is valid"""
-        valid_functions = ["GV", "ID", "PR", "DE", "RS", "RC"]
-        if v not in valid_functions:
-            raise ValueError(f"Invalid function identifier: {v}")
-        return v
 
 
 class CSFCategory(BaseCSFElement):
     """Represents a CSF Category within a Function"""
     element_type: Literal[ElementType.CATEGORY] = Field(default=ElementType.CATEGORY)
     
+    # Parent identifiers are derived on access, so copies with a new ID stay correct
+    @property
+    def parent_function(self) -> str:
+        """Parent function identifier (e.g. GV for GV.OC)"""
+        return _head(self.element_identifier, '.')
+    
     def get_parent_function(self) -> str:
         """Get the parent function identifier"""
-        return self.element_identifier.split('.')[0]
+        return self.parent_function
 
 
 class CSFSubcategory(BaseCSFElement):
     """Represents a CSF Subcategory within a Category"""
     element_type: Literal[ElementType.SUBCATEGORY] = Field(default=ElementType.SUBCATEGORY)
     
+    @property
+    def parent_category(self) -> str:
+        """Parent category identifier (e.g. GV.OC for GV.OC-01)"""
+        return _head(self.element_identifier, '-')
+    
+    @property
+    def parent_function(self) -> str:
+        """Parent function identifier (e.g. GV for GV.OC-01)"""
+        return _head(self.element_identifier, '.')
+    
     def get_parent_category(self) -> str:
         """Get the parent category identifier"""
-        parts = self.element_identifier.split('-')
-        return parts[0] if parts else ""
+        return self.parent_category
     
     def get_parent_function(self) -> str:
         """Get the parent function identifier"""
-        return self.element_identifier.split('.')[0]
+        return self.parent_function
 
 
 class CSFImplementationExample(BaseCSFElement):
     """Represents an implementation example for a subcategory"""
     element_type: Literal[ElementType.IMPLEMENTATION_EXAMPLE] = Field(default=ElementType.IMPLEMENTATION_EXAMPLE)
     
-    def get_parent_subcategory(self) -> Optional[str]:
-        """Extract parent subcategory from implementation example ID"""
+    @property
+    def parent_subcategory(self) -> Optional[str]:
+        """Parent subcategory identifier (e.g. GV.OC-01 for GV.OC-01.001)"""
         # Format: GV.OC-01.001
-        if '.' in self.element_identifier and '-' in self.element_identifier:
-            parts = self.element_identifier.rsplit('.', 1)
-            if len(parts) == 2:
-                return parts[0]
+        if '-' in self.element_identifier:
+            idx = self.element_identifier.rfind('.')
+            if idx != -1:
+                return self.element_identifier[:idx]
         return None
+    
+    def get_parent_subcategory(self) -> Optional[str]:
+        """Extract parent subcategory from implementation example ID"""
+        return self.parent_subcategory
 
 
 class CSFParty(BaseCSFElement):
     """Represents a party (1st or 3rd party risk)"""
     element_type: Literal[ElementType.PARTY] = Field(default=ElementType.PARTY)
     
-    @field_validator('element_identifier')
-    @classmethod
-    def validate_party_id(cls, v):
-        """Validate party identifier"""
-        if v not in ['first', 'third']:
-            raise ValueError(f"Party identifier must be 'first' or 'third': {v}")
-        return v
-    
     def get_party_type(self) -> PartyType:
         """Get the party type enum"""
         return PartyType.FIRST_PARTY if self.element_identifier == 'first' else PartyType.THIRD_PARTY
@@ -250,8 +348,7 @@ class CSFRelationship(BaseModel):
     @classmethod
     def validate_relationship_type(cls, v):
         """Validate relationship type"""
-        valid_types = ['projection', 'related_to', 'supersedes', 'incorporated_into']
-        if v not in valid_types:
+        if v not in _RELATIONSHIP_TYPES:
             raise ValueError(f"Invalid relationship type: {v}")
         return v
     
@@ -277,23 +374,54 @@ class CSFFramework(BaseModel):
     categories_cache: Optional[Dict[str, BaseCSFElement]] = Field(default=None, exclude=True)
     subcategories_cache: Optional[Dict[str, BaseCSFElement]] = Field(default=None, exclude=True)
     
+    _elements_by_type_cache: Optional[Dict[str, Dict[str, BaseCSFElement]]] = PrivateAttr(default=None)
+    _elements_by_id_cache: Optional[Dict[str, BaseCSFElement]] = PrivateAttr(default=None)
+    
+    # Parent -> children indices, keyed by every identifier prefix that ends
+    # at a separator so lookups match the previous startswith() scans exactly
+    _categories_by_function_cache: Optional[Dict[str, List[BaseCSFElement]]] = PrivateAttr(default=None)
+    _subcategories_by_category_cache: Optional[Dict[str, List[BaseCSFElement]]] = PrivateAttr(default=None)
+    _implementation_examples_cache: Optional[Dict[str, List[BaseCSFElement]]] = PrivateAttr(default=None)
+    _related_elements_cache: Optional[Dict[str, List[tuple[str, BaseCSFElement]]]] = PrivateAttr(default=None)
+    
     def __init__(self, **data):
         super().__init__(**data)
         self._build_caches()
     
     def _build_caches(self):
         """Build lookup caches for faster access"""
-        self.functions_cache = {}
-        self.categories_cache = {}
-        self.subcategories_cache = {}
+        by_type = defaultdict(dict)
+        by_id = {}
         
         for element in self.elements:
-            if element.element_type == ElementType.FUNCTION:
-                self.functions_cache[element.element_identifier] = element
-            elif element.element_type == ElementType.CATEGORY:
-                self.categories_cache[element.element_identifier] = element
-            elif element.element_type == ElementType.SUBCATEGORY:
-                self.subcategories_cache[element.element_identifier] = element
+            # Duplicate IDs occur in the NIST data; the first occurrence wins
+            by_id.setdefault(element.element_identifier, element)
+            by_type[element.element_type][element.element_identifier] = element
+        
+        self._elements_by_type_cache = by_type
+        self._elements_by_id_cache = by_id
+        
+        # Per-type caches are views into _elements_by_type_cache
+        self.functions_cache = by_type[_ET_FUNCTION]
+        self.categories_cache = by_type[_ET_CATEGORY]
+        self.subcategories_cache = by_type[_ET_SUBCATEGORY]
+        
+        self._categories_by_function_cache = _index_by_prefixes(self.categories_cache, '.')
+        self._subcategories_by_category_cache = _index_by_prefixes(self.subcategories_cache, '-')
+        self._implementation_examples_cache = _index_by_prefixes(by_type[_ET_IMPL_EX], '.')
+        
+        related = defaultdict(list)
+        for rel in self.relationships:
+            source_id = rel.source_element_identifier
+            dest_id = rel.dest_element_identifier
+            dest_elem = by_id.get(dest_id)
+            if dest_elem:
+                related[source_id].append((rel.relationship_identifier, dest_elem))
+            if dest_id != source_id:
+                source_elem = by_id.get(source_id)
+                if source_elem:
+                    related[dest_id].append((f"reverse_{rel.relationship_identifier}", source_elem))
+        self._related_elements_cache = related
     
     def get_function(self, function_id: str) -> Optional[BaseCSFElement]:
         """Get a function by ID"""
@@ -309,74 +437,79 @@ class CSFFramework(BaseModel):
     
     def get_categories_for_function(self, function_id: str) -> List[BaseCSFElement]:
         """Get all categories for a specific function"""
-        return [
-            cat for cat_id, cat in self.categories_cache.items()
-            if cat_id.startswith(f"{function_id}.")
-        ]
+        return list(self._categories_by_function_cache.get(function_id, ()))
     
     def get_subcategories_for_category(self, category_id: str) -> List[BaseCSFElement]:
         """Get all subcategories for a specific category"""
-        return [
-            subcat for subcat_id, subcat in self.subcategories_cache.items()
-            if subcat_id.startswith(f"{category_id}-")
-        ]
+        return list(self._subcategories_by_category_cache.get(category_id, ()))
     
     def get_implementation_examples(self, subcategory_id: str) -> List[BaseCSFElement]:
         """Get implementation examples for a subcategory"""
-        return [
-            elem for elem in self.elements
-            if elem.element_type == ElementType.IMPLEMENTATION_EXAMPLE
-            and elem.element_identifier.startswith(f"{subcategory_id}.")
-        ]
+        return list(self._implementation_examples_cache.get(subcategory_id, ()))
     
     def get_related_elements(self, element_id: str) -> List[tuple[str, BaseCSFElement]]:
         """Get elements related to a given element ID"""
-        related = []
-        for rel in self.relationships:
-            if rel.source_element_identifier == element_id:
-                dest_elem = self.get_element_by_id(rel.dest_element_identifier)
-                if dest_elem:
-                    related.append((rel.relationship_identifier, dest_elem))
-            elif rel.dest_element_identifier == element_id:
-                source_elem = self.get_element_by_id(rel.source_element_identifier)
-                if source_elem:
-                    related.append((f"reverse_{rel.relationship_identifier}", source_elem))
-        return related
+        return list(self._related_elements_cache.get(element_id, ()))
     
     def get_element_by_id(self, element_id: str) -> Optional[BaseCSFElement]:
         """Get any element by its identifier"""
-        for element in self.elements:
-            if element.element_identifier == element_id:
-                return element
-        return None
+        return self._elements_by_id_cache.get(element_id)
     
     def validate_framework_integrity(self) -> List[str]:
         """Validate the integrity of the framework data"""
         errors = []
         
+        # Counted from the live element list, which may have changed since
+        # the caches were built; the counts double as the set of valid IDs
+        id_counts = Counter(e.element_identifier for e in self.elements)
+        
         # Check for duplicate element IDs
-        element_ids = [e.element_identifier for e in self.elements]
-        duplicates = [id for id in element_ids if element_ids.count(id) > 1]
+        duplicates = [id for id, count in id_counts.items() if count > 1]
         if duplicates:
             errors.append(f"Duplicate element IDs found: {set(duplicates)}")
         
         # Check relationships reference valid elements
-        valid_ids = set(element_ids)
         for rel in self.relationships:
-            if rel.source_element_identifier not in valid_ids:
+            if rel.source_element_identifier not in id_counts:
                 errors.append(f"Relationship references invalid source: {rel.source_element_identifier}")
-            if rel.dest_element_identifier not in valid_ids:
+            if rel.dest_element_identifier not in id_counts:
                 errors.append(f"Relationship references invalid destination: {rel.dest_element_identifier}")
         
         # Check category-subcategory hierarchy
         for subcat in self.subcategories_cache.values():
-            parent_cat = subcat.element_identifier.split('-')[0]
+            parent_cat = _head(subcat.element_identifier, '-')
             if parent_cat not in self.categories_cache:
                 errors.append(f"Subcategory {subcat.element_identifier} references non-existent category {parent_cat}")
         
         return errors
 
 
+# ============================================================================
+# TIMESTAMPS
+# ============================================================================
+
+_frozen_now: ContextVar[Optional[datetime]] = ContextVar('_frozen_now', default=None)
+
+
+def _now_utc() -> datetime:
+    """Current UTC time, or the shared timestamp inside frozen_clock()"""
+    frozen = _frozen_now.get()
+    return frozen if frozen is not None else datetime.now(timezone.utc)
+
+
+@contextmanager
+def frozen_clock(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """Give every model created inside the block the same timestamp
+    
+    Useful for bulk imports, where one clock read per batch is enough.
+    """
+    token = _frozen_now.set(now or datetime.now(timezone.utc))
+    try:
+        yield _frozen_now.get()
+    finally:
+        _frozen_now.reset(token)
+
+
 # ============================================================================
 # ORGANIZATIONAL DATA MODELS (Dynamic/User Data)
 # ============================================================================
@@ -387,151 +520,272 @@ class OrganizationProfile(BaseModel):
     org_name: str = Field(..., description="Organization name")
     industry: str = Field(..., description="Industry sector")
     size: str = Field(..., description="Organization size category")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
+    updated_at: datetime = Field(default_factory=_now_utc)
     
     # CSF Implementation details
     current_tier: Optional[ImplementationTier] = None
     target_tier: Optional[ImplementationTier] = None
     
-    @model_validator(mode='before')
-    @classmethod
-    def update_timestamp(cls, values):
+    def touch(self) -> None:
         """Update the updated_at timestamp"""
-        if isinstance(values, dict):
-            values['updated_at'] = datetime.now(timezone.utc)
-        return values
+        self.updated_at = _now_utc()
 
 
 class SubcategoryImplementation(BaseModel):
     """Organization's implementation status for a specific subcategory"""
+    model_config = ConfigDict(use_enum_values=True)
+    
     org_id: str = Field(..., description="Organization identifier")
     subcategory_id: str = Field(..., description="CSF Subcategory identifier")
-    implementation_status: str = Field(..., description="Implementation status")
+    implementation_status: ImplementationStatus = Field(..., description="Implementation status")
     maturity_level: int = Field(ge=0, le=5, description="Maturity level (0-5)")
     notes: Optional[str] = Field(None, description="Implementation notes")
     evidence: Optional[List[str]] = Field(default_factory=list, description="Evidence/documentation links")
-    last_assessed: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_assessed: datetime = Field(default_factory=_now_utc)
     assessed_by: Optional[str] = Field(None, description="Assessor identifier")
     
     @field_validator('subcategory_id')
     @classmethod
     def validate_subcategory_format(cls, v):
         """Validate subcategory ID format"""
-        if not re.match(r'^[A-Z]{2}\.[A-Z]{2}-\d{2}$', v):
+        if not _is_subcategory_id(v):
             raise ValueError(f"Invalid subcategory ID format: {v}")
         return v
-    
-    @field_validator('implementation_status')
-    @classmethod
-    def validate_status(cls, v):
-        """Validate implementation status"""
-        valid_statuses = ['Not Implemented', 'Partially Implemented', 'Largely Implemented', 'Fully Implemented']
-        if v not in valid_statuses:
-            raise ValueError(f"Invalid implementation status: {v}")
-        return v
 
 
 class RiskAssessment(BaseModel):
     """Risk assessment for a specific CSF element"""
+    model_config = ConfigDict(use_enum_values=True)
+    
     org_id: str = Field(..., description="Organization identifier")
     element_id: str = Field(..., description="CSF element identifier")
-    risk_level: str = Field(..., description="Risk level")
+    risk_level: RiskLevel = Field(..., description="Risk level")
     likelihood: int = Field(ge=1, le=5, description="Likelihood score (1-5)")
     impact: int = Field(ge=1, le=5, description="Impact score (1-5)")
-    risk_score: float = Field(..., description="Calculated risk score")
     mitigation_status: str = Field(..., description="Mitigation status")
     mitigation_plan: Optional[str] = Field(None, description="Mitigation plan description")
-    assessment_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    assessment_date: datetime = Field(default_factory=_now_utc)
     next_review_date: Optional[datetime] = None
     
-    @field_validator('risk_level')
-    @classmethod
-    def validate_risk_level(cls, v):
-        """Validate risk level"""
-        valid_levels = ['Low', 'Medium', 'High', 'Critical']
-        if v not in valid_levels:
-            raise ValueError(f"Invalid risk level: {v}")
-        return v
-    
-    @model_validator(mode='after')
-    def calculate_risk_score(self):
+    @computed_field(description="Calculated risk score")
+    @property
+    def risk_score(self) -> float:
         """Calculate risk score from likelihood and impact"""
-        self.risk_score = self.likelihood * self.impact / 5.0  # Normalize to 0-5 scale
-        return self
+        return self.likelihood * self.impact / 5.0  # Normalize to 0-5 scale
+    
+    @classmethod
+    def from_columns(cls, **columns: List[Any]) -> List['RiskAssessment']:
+        """Create assessments in bulk from parallel columns (e.g. a CSV import)
+        
+        All rows are validated in one pass through the cached list adapter
+        instead of one constructor call per row.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        names = list(columns)
+        rows = [dict(zip(names, values)) for values in zip(*columns.values())]
+        return _list_adapter(cls).validate_python(rows)
 
 
 class GapAnalysis(BaseModel):
     """Gap analysis between current and target states"""
+    model_config = ConfigDict(use_enum_values=True)
+    
     org_id: str = Field(..., description="Organization identifier")
     category_id: str = Field(..., description="CSF Category identifier")
     current_score: float = Field(ge=0, le=5, description="Current maturity score")
     target_score: float = Field(ge=0, le=5, description="Target maturity score")
-    gap_score: float = Field(..., description="Gap between current and target")
-    priority: str = Field(..., description="Priority level for addressing gap")
+    priority: Priority = Field(..., description="Priority level for addressing gap")
     estimated_effort: Optional[str] = Field(None, description="Estimated effort to close gap")
     target_date: Optional[datetime] = None
-    analysis_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    analysis_date: datetime = Field(default_factory=_now_utc)
     
-    @model_validator(mode='after')
-    def calculate_gap(self):
+    @computed_field(description="Gap between current and target")
+    @property
+    def gap_score(self) -> float:
         """Calculate gap score"""
-        self.gap_score = self.target_score - self.current_score
-        return self
-    
-    @field_validator('priority')
-    @classmethod
-    def validate_priority(cls, v):
-        """Validate priority level"""
-        valid_priorities = ['Low', 'Medium', 'High', 'Critical']
-        if v not in valid_priorities:
-            raise ValueError(f"Invalid priority level: {v}")
-        return v
+        return self.target_score - self.current_score
 
 
 # ============================================================================
 # FACTORY FUNCTIONS
 # ============================================================================
 
-def create_element_from_dict(data: Dict[str, Any]) -> BaseCSFElement:
-    """Factory function to create appropriate element type from dictionary"""
-    element_type = data.get('element_type')
-    
-    if element_type == 'function':
-        return CSFFunctionElement(**data)
-    elif element_type == 'category':
-        return CSFCategory(**data)
-    elif element_type == 'subcategory':
-        return CSFSubcategory(**data)
-    elif element_type == 'implementation_example':
-        return CSFImplementationExample(**data)
-    elif element_type == 'party':
-        return CSFParty(**data)
-    elif element_type == 'withdraw_reason':
-        return CSFWithdrawReason(**data)
-    else:
-        return BaseCSFElement(**data)
-
-
-def load_framework_from_json(json_path: str) -> CSFFramework:
-    """Load CSF framework from JSON file"""
-    import json
-    
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+# Element class for each element_type value
+_ELEMENT_CLASSES = {
+    'function': CSFFunctionElement,
+    'category': CSFCategory,
+    'subcategory': CSFSubcategory,
+    'implementation_example': CSFImplementationExample,
+    'party': CSFParty,
+    'withdraw_reason': CSFWithdrawReason,
+}
+
+_REQUIRED_ELEMENT_FIELDS = ('doc_identifier', 'element_identifier', 'element_type')
+
+
+def _validate_shape(data: Dict[str, Any]) -> None:
+    """Cheap structural check used when full validation is skipped"""
+    missing = [name for name in _REQUIRED_ELEMENT_FIELDS if not data.get(name)]
+    if missing:
+        raise ValueError(f"Element is missing required fields {missing}: {data}")
+
+
+def create_element_from_dict(data: Dict[str, Any], validate: bool = True) -> BaseCSFElement:
+    """Factory function to create appropriate element type from dictionary
+    
+    With validate=False the element is built via model_construct, skipping
+    field validators. Only use it for trusted input such as the NIST JSON.
+    """
+    element_cls = _ELEMENT_CLASSES.get(data.get('element_type'), BaseCSFElement)
     
+    if not validate:
+        _validate_shape(data)
+        return element_cls.model_construct(**data)
+    return element_cls(**data)
+
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: Type[ModelT]) -> TypeAdapter:
+    """Build (once per model) the validator for a list of records"""
+    return TypeAdapter(List[model_cls])
+
+
+def parse_records_json(model_cls: Type[ModelT], payload: Union[str, bytes]) -> List[ModelT]:
+    """Parse a JSON array of records (e.g. SubcategoryImplementation) in bulk
+    
+    Decoding and validation run in a single pydantic-core pass, so no
+    intermediate Python dicts are built for the records.
+    """
+    return _list_adapter(model_cls).validate_json(payload)
+
+
+# Bump when CSFFramework or element models change shape so stale caches are ignored
+_FRAMEWORK_CACHE_VERSION = 7
+
+# A JSON modified this recently may be rewritten again within the same mtime
+# tick, so its size/mtime is not recorded and the next load compares hashes
+_FRAMEWORK_CACHE_RACY_NS = 2_000_000_000
+
+
+def _framework_cache_path(json_path: str) -> Path:
+    """Cache file that sits next to the framework JSON"""
+    return Path(json_path).with_suffix('.cache.pkl')
+
+
+def _framework_stat_key(json_path: str) -> tuple:
+    """Size and modification time of the framework JSON"""
+    st = os.stat(json_path)
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _framework_cache_header(stat_key: Optional[tuple], signature: bytes) -> tuple:
+    """Header identifying the cache format and the JSON it was built from"""
+    return (_FRAMEWORK_CACHE_VERSION, PYDANTIC_VERSION, stat_key, signature)
+
+
+def _read_framework_cache(cache_path: Path, stat_key: Optional[tuple] = None,
+                          signature: Optional[bytes] = None) -> Optional[CSFFramework]:
+    """Return the cached framework if it matches the JSON's stat key or SHA-1"""
+    try:
+        with open(cache_path, 'rb') as f:
+            version, pydantic_version, cached_stat_key, cached_signature = pickle.load(f)
+            if (version, pydantic_version) != (_FRAMEWORK_CACHE_VERSION, PYDANTIC_VERSION):
+                return None
+            stat_match = stat_key is not None and cached_stat_key == stat_key
+            signature_match = signature is not None and cached_signature == signature
+            if not (stat_match or signature_match):
+                return None
+            framework = pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible cache; fall back to parsing
+        return None
+    return framework if isinstance(framework, CSFFramework) else None
+
+
+def _current_umask() -> int:
+    """Return the process umask (it can only be read by setting it)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _write_framework_cache(cache_path: Path, stat_key: tuple, signature: bytes, framework: CSFFramework) -> None:
+    """Atomically write the framework cache, ignoring unwritable locations"""
+    # A recently modified JSON is identified by its SHA-1 alone
+    settled = stat_key[1] <= time.time_ns() - _FRAMEWORK_CACHE_RACY_NS
+    header = _framework_cache_header(stat_key if settled else None, signature)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            # mkstemp creates the file 0600; let other users (e.g. the service
+            # account when the cache was built during an image build) read it
+            os.fchmod(fd, 0o644 & ~_current_umask())
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(framework, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        # The cache is an optimisation only; never fail the load over it
+        pass
+
+
+def _parse_framework_json(raw: bytes) -> CSFFramework:
+    """Build the framework from the raw NIST JSON export"""
+    data = _json_loads(raw)
     framework_data = data['response']['elements']
     
-    # Create framework object
-    framework = CSFFramework(
-        documents=[CSFDocument(**doc) for doc in framework_data.get('documents', [])],
-        elements=[create_element_from_dict(elem) for elem in framework_data.get('elements', [])],
-        relationships=[CSFRelationship(**rel) for rel in framework_data.get('relationships', [])]
+    # Create framework object. The NIST export is trusted, so models are
+    # built without validators; the integrity check still runs on load.
+    return CSFFramework(
+        documents=[CSFDocument.model_construct(**doc) for doc in framework_data.get('documents', [])],
+        elements=[create_element_from_dict(elem, validate=False) for elem in framework_data.get('elements', [])],
+        relationships=[CSFRelationship.model_construct(**rel) for rel in framework_data.get('relationships', [])]
     )
-    
-    # Validate integrity
+
+
+def _checked_framework(framework: CSFFramework) -> CSFFramework:
+    """Warn about integrity issues and return the framework"""
     errors = framework.validate_framework_integrity()
     if errors:
         print(f"Warning: Framework integrity issues found: {errors}")
-    
-    return framework
\ No newline at end of file
+    return framework
+
+
+def load_framework_from_json(json_path: str, use_cache: bool = True) -> CSFFramework:
+    """Load CSF framework from JSON file
+    
+    The parsed framework is pickled next to the JSON file (e.g.
+    csf-2.0-framework.cache.pkl). While the JSON's size and mtime are
+    unchanged the cache is used without reading the JSON at all; otherwise
+    it is used if the JSON's SHA-1 still matches. The cache is trusted like
+    the JSON itself; pass use_cache=False to always parse.
+    """
+    if not use_cache:
+        return _checked_framework(_parse_framework_json(Path(json_path).read_bytes()))
+    
+    cache_path = _framework_cache_path(json_path)
+    stat_key = _framework_stat_key(json_path)
+    framework = _read_framework_cache(cache_path, stat_key=stat_key)
+    if framework is not None:
+        return _checked_framework(framework)
+    
+    raw = Path(json_path).read_bytes()
+    signature = hashlib.sha1(raw).digest()
+    framework = _read_framework_cache(cache_path, signature=signature)
+    if framework is not None:
+        # Same contents under a new mtime (e.g. a fresh checkout)
+        _write_framework_cache(cache_path, stat_key, signature, framework)
+        return _checked_framework(framework)
+    
+    framework = _parse_framework_json(raw)
+    _write_framework_cache(cache_path, stat_key, signature, framework)
+    return _checked_framework(framework)
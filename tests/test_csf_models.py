@@ -3,14 +3,20 @@ Tests for NIST CSF 2.0 Data Models
 """
 
 import json
+import os
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_FRAMEWORK_JSON = _REPO_ROOT / "data" / "csf-2.0-framework.json"
 
 # Add src to path for imports
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(_REPO_ROOT))
 
 from src.models.csf_models import (
     CSFDocument,
@@ -25,51 +31,72 @@ from src.models.csf_models import (
     PartyType,
     RelationshipType,
     ImplementationTier,
+    ImplementationStatus,
+    RiskLevel,
+    Priority,
     OrganizationProfile,
     SubcategoryImplementation,
     RiskAssessment,
     GapAnalysis,
     create_element_from_dict,
     load_framework_from_json,
-    CSFFunction
+    parse_records_json,
+    frozen_clock,
+    CSFFunction,
+    BaseCSFElement
 )
 
 
+@lru_cache(maxsize=None)
+def _cached_element(**fields: str) -> BaseCSFElement:
+    """Build an element once per distinct input; elements are immutable"""
+    return create_element_from_dict(fields)
+
+
+@pytest.fixture(scope="session")
+def loaded_framework() -> CSFFramework:
+    """The complete framework, parsed once per test session"""
+    if not _FRAMEWORK_JSON.exists():
+        pytest.skip("CSF framework JSON file not found")
+    # Parse the JSON itself and leave no cache file in the working tree
+    return load_framework_from_json(str(_FRAMEWORK_JSON), use_cache=False)
+
+
 class TestCSFModels:
     """Test CSF data models"""
     
-    @pytest.fixture
-    def sample_function_data(self) -> Dict[str, Any]:
-        """Sample function data"""
-        return {
+    @pytest.fixture(scope="session")
+    def sample_function_data(self) -> Mapping[str, Any]:
+        """Sample function data (read-only, shared across tests)"""
+        return MappingProxyType({
             "doc_identifier": "CSF_2_0_0",
             "element_identifier": "GV",
             "element_type": "function",
             "text": "The organization's cybersecurity risk management strategy",
             "title": "GOVERN"
-        }
+        })
     
-    @pytest.fixture
-    def sample_category_data(self) -> Dict[str, Any]:
-        """Sample category data"""
-        return {
+    @pytest.fixture(scope="session")
+    def sample_category_data(self) -> Mapping[str, Any]:
+        """Sample category data (read-only, shared across tests)"""
+        return MappingProxyType({
             "doc_identifier": "CSF_2_0_0",
             "element_identifier": "GV.OC",
             "element_type": "category",
             "text": "Organizational Context",
             "title": "Organizational Context"
-        }
+        })
     
-    @pytest.fixture
-    def sample_subcategory_data(self) -> Dict[str, Any]:
-        """Sample subcategory data"""
-        return {
+    @pytest.fixture(scope="session")
+    def sample_subcategory_data(self) -> Mapping[str, Any]:
+        """Sample subcategory data (read-only, shared across tests)"""
+        return MappingProxyType({
             "doc_identifier": "CSF_2_0_0",
             "element_identifier": "GV.OC-01",
             "element_type": "subcategory",
             "text": "The organizational mission is understood",
             "title": ""
-        }
+        })
     
     def test_csf_document(self):
         """Test CSF document model"""
@@ -89,11 +116,24 @@ class TestCSFModels:
         assert func.element_type == ElementType.FUNCTION
         assert func.title == "GOVERN"
     
+    def test_csf_function_enum(self):
+        """Test CSF function enum helpers"""
+        assert CSFFunction.from_string("gv") == CSFFunction.GOVERN
+        assert CSFFunction.from_string("Recover") == CSFFunction.RECOVER
+        assert CSFFunction.PROTECT.get_full_name() == "PROTECT"
+        
+        with pytest.raises(ValueError):
+            CSFFunction.from_string("XX")
+    
     def test_csf_category(self, sample_category_data):
         """Test CSF category model"""
         cat = CSFCategory(**sample_category_data)
         assert cat.element_identifier == "GV.OC"
         assert cat.get_parent_function() == "GV"
+        
+        # Elements are immutable once created
+        with pytest.raises(ValueError):
+            cat.element_identifier = "ID.AM"
     
     def test_csf_subcategory(self, sample_subcategory_data):
         """Test CSF subcategory model"""
@@ -101,6 +141,15 @@ class TestCSFModels:
         assert subcat.element_identifier == "GV.OC-01"
         assert subcat.get_parent_category() == "GV.OC"
         assert subcat.get_parent_function() == "GV"
+        assert subcat.parent_category == "GV.OC"
+        # Derived parents are not part of the serialized element
+        assert "parent_category" not in subcat.model_dump()
+        
+        # Parents follow the identifier of an updated copy
+        moved = subcat.model_copy(update={"element_identifier": "ID.AM-02"})
+        assert moved.get_parent_category() == "ID.AM"
+        assert moved.get_parent_function() == "ID"
+        assert subcat.get_parent_category() == "GV.OC"
     
     def test_element_validation(self):
         """Test element identifier validation"""
@@ -134,6 +183,35 @@ class TestCSFModels:
                 title="Test"
             )
     
+    def test_base_element_validation(self):
+        """Test identifier checks apply to BaseCSFElement, not only subclasses"""
+        with pytest.raises(ValueError):
+            BaseCSFElement(doc_identifier="CSF_2_0_0", element_identifier="XX", element_type="function")
+        with pytest.raises(ValueError):
+            BaseCSFElement(doc_identifier="CSF_2_0_0", element_identifier="second", element_type="party")
+        
+        # Implementation example identifiers are free-form
+        example = BaseCSFElement(
+            doc_identifier="CSF_2_0_0",
+            element_identifier="GV.OC-01.ex1",
+            element_type="implementation_example"
+        )
+        assert example.element_identifier == "GV.OC-01.ex1"
+    
+    def test_identifier_format_edge_cases(self):
+        """Test identifiers of the right length but the wrong characters"""
+        for identifier in ["gv.oc", "G1.OC", "GV-OC", "GV.O1"]:
+            with pytest.raises(ValueError):
+                CSFCategory(doc_identifier="CSF_2_0_0", element_identifier=identifier)
+        
+        # Only ASCII digits are accepted (e.g., not the fullwidth "０")
+        for identifier in ["GV.OC-1A", "GV.OC-01x", "GV.OC-０1", "GV.OC.01", "gv.oc-01"]:
+            with pytest.raises(ValueError):
+                CSFSubcategory(doc_identifier="CSF_2_0_0", element_identifier=identifier)
+        
+        assert CSFCategory(doc_identifier="CSF_2_0_0", element_identifier="ID.AM").element_identifier == "ID.AM"
+        assert CSFSubcategory(doc_identifier="CSF_2_0_0", element_identifier="ID.AM-08").element_identifier == "ID.AM-08"
+    
     def test_csf_party(self):
         """Test CSF party model"""
         party = CSFParty(
@@ -179,6 +257,36 @@ class TestCSFModels:
         )
         assert org.org_id == "ORG-001"
         assert org.current_tier == ImplementationTier.TIER_2_RISK_INFORMED
+        
+        created_at, updated_at = org.created_at, org.updated_at
+        org.touch()
+        assert org.updated_at >= updated_at
+        assert org.created_at == created_at
+    
+    def test_frozen_clock(self):
+        """Test models created in a frozen clock share one timestamp"""
+        with frozen_clock() as now:
+            org = OrganizationProfile(
+                org_id="ORG-001",
+                org_name="Test Organization",
+                industry="Technology",
+                size="Large"
+            )
+            impl = SubcategoryImplementation(
+                org_id="ORG-001",
+                subcategory_id="GV.OC-01",
+                implementation_status="Partially Implemented",
+                maturity_level=3
+            )
+        assert org.created_at == org.updated_at == impl.last_assessed == now
+        
+        later = SubcategoryImplementation(
+            org_id="ORG-001",
+            subcategory_id="GV.OC-01",
+            implementation_status="Partially Implemented",
+            maturity_level=3
+        )
+        assert later.last_assessed >= now
     
     def test_subcategory_implementation(self):
         """Test subcategory implementation model"""
@@ -190,6 +298,8 @@ class TestCSFModels:
             notes="In progress"
         )
         assert impl.maturity_level == 3
+        assert impl.implementation_status == ImplementationStatus.PARTIALLY_IMPLEMENTED
+        assert impl.model_dump()["implementation_status"] == "Partially Implemented"
         
         # Test invalid subcategory format
         with pytest.raises(ValueError):
@@ -209,6 +319,25 @@ class TestCSFModels:
                 maturity_level=3
             )
     
+    def test_parse_records_json(self):
+        """Test bulk parsing of organizational records from JSON"""
+        payload = json.dumps([
+            {
+                "org_id": "ORG-001",
+                "subcategory_id": subcategory_id,
+                "implementation_status": "Fully Implemented",
+                "maturity_level": 4
+            }
+            for subcategory_id in ["GV.OC-01", "GV.OC-02"]
+        ])
+        records = parse_records_json(SubcategoryImplementation, payload)
+        assert [r.subcategory_id for r in records] == ["GV.OC-01", "GV.OC-02"]
+        assert all(isinstance(r, SubcategoryImplementation) for r in records)
+        
+        # Records are validated like individual models
+        with pytest.raises(ValueError):
+            parse_records_json(SubcategoryImplementation, payload.replace("GV.OC-02", "INVALID"))
+    
     def test_risk_assessment(self):
         """Test risk assessment model"""
         risk = RiskAssessment(
@@ -217,11 +346,16 @@ class TestCSFModels:
             risk_level="High",
             likelihood=4,
             impact=5,
-            risk_score=4.0,
             mitigation_status="In Progress"
         )
         assert risk.likelihood == 4
         assert risk.impact == 5
+        assert risk.risk_level == RiskLevel.HIGH
+        # Enum members are stored as their plain values
+        assert f"{risk.risk_level}" == "High"
+        assert risk.model_dump()["risk_level"] == "High"
+        assert risk.risk_score == 4.0
+        assert risk.model_dump()["risk_score"] == 4.0
         
         # Test invalid risk level
         with pytest.raises(ValueError):
@@ -231,8 +365,33 @@ class TestCSFModels:
                 risk_level="Invalid",
                 likelihood=4,
                 impact=5,
-                risk_score=4.0,
-                mitigation_status="In Progress"
+                    mitigation_status="In Progress"
+            )
+    
+    def test_risk_assessment_from_columns(self):
+        """Test bulk creation of risk assessments from columns"""
+        risks = RiskAssessment.from_columns(
+            org_id=["ORG-001", "ORG-001"],
+            element_id=["GV.OC-01", "ID.AM-01"],
+            risk_level=["High", "Low"],
+            likelihood=[4, 1],
+            impact=[5, 2],
+            mitigation_status=["In Progress", "Planned"]
+        )
+        assert [r.element_id for r in risks] == ["GV.OC-01", "ID.AM-01"]
+        assert [r.risk_score for r in risks] == [4.0, 0.4]
+        assert risks[1].risk_level == RiskLevel.LOW
+        
+        with pytest.raises(ValueError):
+            RiskAssessment.from_columns(org_id=["ORG-001"], likelihood=[1, 2])
+        with pytest.raises(ValueError):
+            RiskAssessment.from_columns(
+                org_id=["ORG-001"],
+                element_id=["GV.OC-01"],
+                risk_level=["High"],
+                likelihood=[9],
+                impact=[5],
+                mitigation_status=["Planned"]
             )
     
     def test_gap_analysis(self):
@@ -240,13 +399,14 @@ class TestCSFModels:
         gap = GapAnalysis(
             org_id="ORG-001",
             category_id="GV.OC",
-            current_score=2.5,
-            target_score=4.0,
-            gap_score=1.5,
+            current_score=1,
+            target_score=3,
             priority="High"
         )
-        assert gap.current_score == 2.5
-        assert gap.gap_score == 1.5
+        assert gap.current_score == 1.0
+        assert gap.gap_score == 2.0
+        assert gap.priority == Priority.HIGH
+        assert gap.model_dump()["priority"] == "High"
         
         # Test invalid priority
         with pytest.raises(ValueError):
@@ -255,7 +415,6 @@ class TestCSFModels:
                 category_id="GV.OC",
                 current_score=2.5,
                 target_score=4.0,
-                gap_score=1.5,
                 priority="Invalid"
             )
     
@@ -266,19 +425,22 @@ class TestCSFModels:
         
         cat = create_element_from_dict(sample_category_data)
         assert isinstance(cat, CSFCategory)
+        
+        # Trusted fast path skips validators but keeps the element class
+        trusted = create_element_from_dict(sample_category_data, validate=False)
+        assert isinstance(trusted, CSFCategory)
+        assert trusted.get_parent_function() == "GV"
+        
+        with pytest.raises(ValueError):
+            create_element_from_dict({"element_type": "category"}, validate=False)
 
 
 class TestCSFFrameworkLoading:
     """Test loading and working with the complete framework"""
     
-    def test_load_framework_from_json(self):
+    def test_load_framework_from_json(self, loaded_framework):
         """Test loading framework from JSON file"""
-        json_path = Path(__file__).parent.parent / "csf-2.0-framework.json"
-        
-        if not json_path.exists():
-            pytest.skip("CSF framework JSON file not found")
-        
-        framework = load_framework_from_json(str(json_path))
+        framework = loaded_framework
         
         # Verify framework loaded correctly
         assert len(framework.documents) > 0
@@ -309,6 +471,63 @@ class TestCSFFrameworkLoading:
         # Duplicates are expected in the NIST data (elements repeated for 1st/3rd party)
         assert len(errors) == 0 or all('duplicate' in str(e).lower() for e in errors)
 
+    def test_load_framework_from_cache_matches_json(self, loaded_framework, tmp_path):
+        """Test a cached load of the real framework matches a fresh parse"""
+        json_path = tmp_path / _FRAMEWORK_JSON.name
+        json_path.write_bytes(_FRAMEWORK_JSON.read_bytes())
+        
+        load_framework_from_json(str(json_path))
+        cached = load_framework_from_json(str(json_path))
+        
+        assert cached.model_dump() == loaded_framework.model_dump()
+        assert cached.get_categories_for_function("GV") == loaded_framework.get_categories_for_function("GV")
+        assert cached.get_related_elements("GV") == loaded_framework.get_related_elements("GV")
+    
+    def test_load_framework_uses_cache(self, tmp_path):
+        """Test the parsed framework is cached next to the JSON file"""
+        def write_framework(title):
+            payload = {"response": {"elements": {
+                "documents": [],
+                "elements": [{
+                    "doc_identifier": "CSF_2_0_0",
+                    "element_identifier": "GV",
+                    "element_type": "function",
+                    "text": "",
+                    "title": title
+                }],
+                "relationships": []
+            }}}
+            json_path.write_text(json.dumps(payload))
+
+        json_path = tmp_path / "framework.json"
+        cache_path = tmp_path / "framework.cache.pkl"
+        write_framework("GOVERN")
+
+        assert load_framework_from_json(str(json_path)).get_function("GV").title == "GOVERN"
+        assert cache_path.exists()
+        umask = os.umask(0)
+        os.umask(umask)
+        assert cache_path.stat().st_mode & 0o777 == 0o644 & ~umask
+        assert load_framework_from_json(str(json_path)).get_function("GV").title == "GOVERN"
+
+        # Changing the JSON invalidates the cache
+        write_framework("GOVERN v2")
+        assert load_framework_from_json(str(json_path)).get_function("GV").title == "GOVERN v2"
+
+        # Caching can be disabled
+        cache_path.unlink()
+        load_framework_from_json(str(json_path), use_cache=False)
+        assert not cache_path.exists()
+
+        # Once the JSON's mtime is settled, an unchanged size and mtime is
+        # enough to use the cache without reading the JSON
+        old_mtime_ns = 1_600_000_000 * 10**9
+        os.utime(json_path, ns=(old_mtime_ns, old_mtime_ns))
+        assert load_framework_from_json(str(json_path)).get_function("GV").title == "GOVERN v2"
+        json_path.write_bytes(b" " * json_path.stat().st_size)
+        os.utime(json_path, ns=(old_mtime_ns, old_mtime_ns))
+        assert load_framework_from_json(str(json_path)).get_function("GV").title == "GOVERN v2"
+
 
 class TestValidationMethods:
     """Test validation methods in models"""
@@ -326,6 +545,13 @@ class TestValidationMethods:
                     text="Test",
                     title="GOVERN"
                 ),
+                CSFFunctionElement(
+                    doc_identifier="CSF_2_0_0",
+                    element_identifier="GV",  # Duplicate ID
+                    element_type="function",
+                    text="Test",
+                    title="GOVERN"
+                ),
                 CSFSubcategory(
                     doc_identifier="CSF_2_0_0",
                     element_identifier="XX.YY-01",  # References non-existent category
@@ -350,6 +576,75 @@ class TestValidationMethods:
         assert len(errors) > 0
         assert any("invalid source" in error.lower() for error in errors)
         assert any("non-existent category" in error.lower() for error in errors)
+        assert "Duplicate element IDs found: {'GV'}" in errors
+    
+    def test_framework_integrity_after_mutation(self):
+        """Test integrity validation sees elements added after construction"""
+        def govern():
+            return CSFFunctionElement(
+                doc_identifier="CSF_2_0_0",
+                element_identifier="GV",
+                element_type="function",
+                text="Test",
+                title="GOVERN"
+            )
+        
+        framework = CSFFramework(documents=[], elements=[govern()], relationships=[])
+        assert framework.validate_framework_integrity() == []
+        
+        framework.elements.append(govern())
+        assert framework.validate_framework_integrity() == ["Duplicate element IDs found: {'GV'}"]
+
+
+class TestFrameworkLookups:
+    """Test cached lookups on the framework model"""
+
+    @pytest.fixture
+    def framework(self) -> CSFFramework:
+        """Small framework covering each level of the hierarchy"""
+        elements = [
+            {"element_identifier": "GV", "element_type": "function"},
+            {"element_identifier": "GV.OC", "element_type": "category"},
+            {"element_identifier": "GV.RM", "element_type": "category"},
+            {"element_identifier": "GV.OC-01", "element_type": "subcategory"},
+            {"element_identifier": "GV.OC-02", "element_type": "subcategory"},
+            {"element_identifier": "GV.OC-01.001", "element_type": "implementation_example"},
+            {"element_identifier": "ID", "element_type": "function"},
+        ]
+        return CSFFramework(
+            documents=[],
+            elements=[_cached_element(doc_identifier="CSF_2_0_0", **elem) for elem in elements],
+            relationships=[
+                CSFRelationship(
+                    source_doc_identifier="CSF_2_0_0",
+                    source_element_identifier=source,
+                    dest_doc_identifier="CSF_2_0_0",
+                    dest_element_identifier=dest,
+                    relationship_identifier="projection",
+                    provenance_doc_identifier="CSF_2_0_0"
+                )
+                for source, dest in [("GV", "GV.OC"), ("GV", "GV.RM"), ("GV.OC", "MISSING")]
+            ]
+        )
+
+    def test_hierarchy_lookups(self, framework):
+        """Test parent to children lookups"""
+        ids = lambda elems: [e.element_identifier for e in elems]
+        assert ids(framework.get_categories_for_function("GV")) == ["GV.OC", "GV.RM"]
+        assert framework.get_categories_for_function("ID") == []
+        assert ids(framework.get_subcategories_for_category("GV.OC")) == ["GV.OC-01", "GV.OC-02"]
+        assert ids(framework.get_implementation_examples("GV.OC-01")) == ["GV.OC-01.001"]
+        assert framework.get_implementation_examples("GV.OC-02") == []
+        assert framework.get_element_by_id("GV.OC-02").element_identifier == "GV.OC-02"
+        assert framework.get_element_by_id("MISSING") is None
+
+    def test_related_elements(self, framework):
+        """Test forward and reverse relationship lookups"""
+        related = [(t, e.element_identifier) for t, e in framework.get_related_elements("GV")]
+        assert related == [("projection", "GV.OC"), ("projection", "GV.RM")]
+
+        related = [(t, e.element_identifier) for t, e in framework.get_related_elements("GV.OC")]
+        assert related == [("reverse_projection", "GV")]
 
 
 if __name__ == "__main__":